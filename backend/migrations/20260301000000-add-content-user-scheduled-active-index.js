@@ -0,0 +1,35 @@
+/**
+ * Migration: Add partial composite index for the user content list
+ * GET /api/content filters by userId + deletedAt IS NULL and orders by scheduledFor DESC.
+ * contents_user_scheduled_idx covers (userId, scheduledFor) but still visits soft-deleted rows;
+ * this partial index serves the list page and its COUNT directly.
+ */
+
+export default {
+  async up(queryInterface) {
+    try {
+      await queryInterface.addIndex('Contents', [
+        'userId',
+        { name: 'scheduledFor', order: 'DESC' },
+      ], {
+        name: 'idx_content_user_scheduled_active',
+        where: {
+          deletedAt: null
+        }
+      });
+    } catch (error) {
+      // Index might already exist, continue
+      if (!error.message?.includes('already exists') && !error.message?.includes('duplicate')) {
+        throw error;
+      }
+    }
+  },
+
+  async down(queryInterface) {
+    try {
+      await queryInterface.removeIndex('Contents', 'idx_content_user_scheduled_active');
+    } catch (error) {
+      // Index might not exist
+    }
+  }
+};
@@ -1,12 +1,62 @@
+import cluster from 'cluster';
 import logger from './utils/logger.js';
+import { isRedisAvailable } from './utils/redisConnection.js';
 import { app, initServer } from './app.js';
 
 /**
  * API entrypoint.
  * - Inicializa base de datos.
  * - Arranca sólo el servidor HTTP (sin scheduler ni workers).
+ * - WEB_CONCURRENCY > 1: forks that many HTTP workers sharing the port (node:cluster).
+ *   Default 1 (single process). Requires Redis: rate limit counters (middleware/rateLimit.js) and
+ *   the auth user cache are only shared between workers through Redis, so without it the API
+ *   refuses to fork and runs a single process (otherwise authLimiter's 5 login attempts would
+ *   become 5 x N per client). While Redis is unreachable, limiters fall back to per-worker memory.
+ *   WebSocket (socket.io) has no shared adapter: real-time events only reach clients connected
+ *   to the emitting worker, and long-polling needs sticky sessions at the proxy.
  */
 
+const WEB_CONCURRENCY = Math.max(1, parseInt(process.env.WEB_CONCURRENCY, 10) || 1);
+// A worker exiting sooner than this after fork counts as a failed start (e.g. DB unreachable)
+const WORKER_MIN_UPTIME_MS = 10000;
+const WORKER_MAX_FAILED_STARTS = 5;
+const WORKER_RESTART_MAX_DELAY_MS = 30000;
+
+function startPrimary() {
+  logger.info('API cluster starting', { workers: WEB_CONCURRENCY });
+
+  const forkedAt = new Map();
+  let failedStarts = 0;
+
+  const fork = () => {
+    const worker = cluster.fork();
+    forkedAt.set(worker.id, Date.now());
+  };
+
+  for (let i = 0; i < WEB_CONCURRENCY; i++) {
+    fork();
+  }
+
+  cluster.on('exit', (worker, code, signal) => {
+    const uptime = Date.now() - (forkedAt.get(worker.id) || 0);
+    forkedAt.delete(worker.id);
+    if (worker.exitedAfterDisconnect) {
+      logger.info('API worker disconnected', { pid: worker.process.pid, code, signal });
+      return;
+    }
+
+    failedStarts = uptime < WORKER_MIN_UPTIME_MS ? failedStarts + 1 : 0;
+    if (failedStarts >= WORKER_MAX_FAILED_STARTS) {
+      logger.error('API workers keep failing on startup, stopping cluster', { failedStarts, code, signal });
+      process.exit(1);
+    }
+
+    const delay = failedStarts > 0 ? Math.min(1000 * 2 ** (failedStarts - 1), WORKER_RESTART_MAX_DELAY_MS) : 0;
+    logger.warn('API worker exited, forking replacement', { pid: worker.process.pid, code, signal, delayMs: delay });
+    setTimeout(fork, delay);
+  });
+}
+
 async function startApi() {
   try {
     await initServer();
@@ -16,7 +66,15 @@ async function startApi() {
   }
 }
 
-startApi();
+if (WEB_CONCURRENCY > 1 && cluster.isPrimary && !isRedisAvailable()) {
+  logger.error('WEB_CONCURRENCY > 1 requires Redis (shared rate limits and auth cache); starting a single process', {
+    webConcurrency: WEB_CONCURRENCY,
+  });
+  startApi();
+} else if (WEB_CONCURRENCY > 1 && cluster.isPrimary) {
+  startPrimary();
+} else {
+  startApi();
+}
 
 export default app;
-
@@ -39,6 +39,7 @@ import { exchangeRateUsdEurHandler } from './routes/admin/exchangeRate.js';
 import { getAlertConfigHandler, putAlertConfigHandler, postAlertConfigTestHandler } from './routes/admin/alerts.js';
 import { getCostMetricsForAdmin } from './services/publicationMetricService.js';
 import { sequelize, SystemConfig } from './models/index.js';
+import { applySqlitePragmas } from './config/database.js';
 import { authenticateToken, requireAuth, requireAdmin } from './middleware/auth.js';
 import { authLimiter, apiLimiter, uploadLimiter } from './middleware/rateLimit.js';
 import { csrfProtection, getCsrfToken } from './middleware/csrf.js';
@@ -168,6 +169,9 @@ app.get('/api/platforms/enabled', async (req, res) => {
   }
 });
 
+// Health checks never read req.user: mount before authenticateToken so probes skip JWT verification and user lookup
+app.use('/api/health', healthRoutes);
+
 // JWT authentication middleware - attaches user to req.user if token is valid
 app.use(authenticateToken);
 
@@ -277,9 +281,6 @@ app.use('/api/messages', messagesRoutes);
 app.use('/api/notifications', notificationsRoutes);
 app.use('/api/admin/platforms', adminPlatformsRoutes);
 
-// Enhanced health check endpoint
-app.use('/api/health', healthRoutes);
-
 // Metrics endpoint (Prometheus format) - disabled by default; set ENABLE_PROMETHEUS_METRICS=true to enable
 if (ENABLE_PROMETHEUS_METRICS) {
   app.get('/api/metrics', (req, res) => {
@@ -347,6 +348,7 @@ const logLevel = process.env.LOG_LEVEL || 'info';
 async function initServer() {
   try {
     await sequelize.authenticate();
+    await applySqlitePragmas();
     const dbType = process.env.DATABASE_URL ? 'PostgreSQL (Supabase)' : 'SQLite';
     logger.info('Database connection established', { dbType, environment: nodeEnv });
     
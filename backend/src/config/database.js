@@ -36,6 +36,13 @@ if (isProduction && !requireSSL) {
   throw new Error('DATABASE_SSL=true is required in production environment');
 }
 
+const SQLITE_PRAGMAS = [
+  'PRAGMA journal_mode=WAL',
+  'PRAGMA synchronous=NORMAL',
+  'PRAGMA temp_store=MEMORY',
+  'PRAGMA mmap_size=268435456',
+];
+
 // Create Sequelize instance
 const sequelize = usePostgres
   ? new Sequelize(databaseUrl, {
@@ -68,4 +75,16 @@ const sequelize = usePostgres
       logging: enableLogging ? (msg) => logger.debug(msg) : false,
     });
 
-export { sequelize, usePostgres, nodeEnv, enableLogging, isProduction, requireSSL };
+/**
+ * Apply performance pragmas to the SQLite database (local/dev only; production uses Postgres).
+ * WAL + synchronous=NORMAL: one fsync per checkpoint instead of per commit; readers don't block the writer.
+ * Call after sequelize.authenticate(): Sequelize's afterConnect hook does not fire for SQLite connections.
+ */
+async function applySqlitePragmas() {
+  if (usePostgres) return;
+  for (const pragma of SQLITE_PRAGMAS) {
+    await sequelize.query(pragma);
+  }
+}
+
+export { sequelize, applySqlitePragmas, usePostgres, nodeEnv, enableLogging, isProduction, requireSSL };
@@ -44,6 +44,9 @@ export const APP_CONFIG = {
     BACKOFF_DELAY: 2000, // 2 seconds
   },
   
+  // Password hashing cost (bcrypt rounds; configurable vía BCRYPT_ROUNDS en env)
+  BCRYPT_ROUNDS: Number(process.env.BCRYPT_ROUNDS) || 10,
+  
   // Signed URL expiration
   SIGNED_URL_EXPIRES_SEC: 3600, // 1 hour
 };
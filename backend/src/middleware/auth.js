@@ -7,10 +7,15 @@ import jwt from 'jsonwebtoken';
 import { User } from '../models/index.js';
 import { normalizeLicenseType, resolveLicenseExpiry } from '../utils/licenseUtils.js';
 import { generateLicenseKey } from '../utils/cryptoUtils.js';
+import cacheService from '../services/cacheService.js';
 import logger from '../utils/logger.js';
 
 const jwtSecret = process.env.JWT_SECRET || 'dev-jwt-secret';
 
+/** Secrets never needed on req.user; excluded from the lookup so they are not cached either. */
+const AUTH_USER_EXCLUDED_ATTRIBUTES = ['passwordHash', 'twitterAccessToken', 'twitterRefreshToken', 'discordAccessToken', 'discordRefreshToken'];
+const AUTH_USER_DATE_FIELDS = ['licenseExpiresAt', 'lastPasswordChange', 'createdAt', 'updatedAt'];
+
 /**
  * If user has no valid license and never used trial, and has OAuth (Google/Twitch/Discord), assign trial once.
  * So users created with licenseType 'none' get trial on next request without re-login.
@@ -37,6 +42,32 @@ async function ensureTrialForOAuthUser(user) {
   }
 }
 
+/**
+ * Load the user for req.user: cache (in-process LRU, then Redis or memory fallback) first, DB on miss.
+ * Entries are invalidated by the User model hooks (models/index.js) on every write.
+ * The returned object is shared with the cache (same reference on in-process hits): req.user must not be mutated.
+ * @param {number} userId
+ * @returns {Promise<object|null>} Plain user object or null
+ */
+async function loadAuthUser(userId) {
+  const cached = await cacheService.get('AUTH_USER', userId);
+  if (cached) {
+    for (const field of AUTH_USER_DATE_FIELDS) {
+      if (cached[field]) cached[field] = new Date(cached[field]);
+    }
+    return cached;
+  }
+
+  const user = await User.findByPk(userId, {
+    attributes: { exclude: AUTH_USER_EXCLUDED_ATTRIBUTES },
+  });
+  if (!user) return null;
+  await ensureTrialForOAuthUser(user);
+  const plain = user.get({ plain: true });
+  await cacheService.set('AUTH_USER', userId, plain);
+  return plain;
+}
+
 /**
  * Middleware to authenticate requests using JWT
  * Attaches user object to req.user if token is valid.
@@ -61,14 +92,9 @@ export function authenticateToken(req, res, next) {
     const payload = jwt.verify(token, jwtSecret);
     
     // Attach user to request (async lookup)
-    User.findByPk(payload.id)
-      .then(async (user) => {
-        if (!user) {
-          req.user = null;
-        } else {
-          await ensureTrialForOAuthUser(user);
-          req.user = user.get({ plain: true });
-        }
+    loadAuthUser(payload.id)
+      .then((user) => {
+        req.user = user;
         next();
       })
       .catch(err => {
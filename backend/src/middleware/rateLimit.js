@@ -6,12 +6,14 @@
 
 import rateLimit from 'express-rate-limit';
 import { APP_CONFIG } from '../constants/app.js';
+import { RedisRateLimitStore } from '../utils/redisRateLimitStore.js';
 
 /**
  * Rate limiter for authentication endpoints (login, register, password reset)
  * Very strict to prevent brute force attacks
  */
 export const authLimiter = rateLimit({
+  store: new RedisRateLimitStore('auth'), // Shared across API workers when Redis is configured
   windowMs: APP_CONFIG.RATE_LIMIT.AUTH_WINDOW,
   max: 5, // 5 attempts per 15 minutes
   message: {
@@ -29,6 +31,7 @@ export const authLimiter = rateLimit({
  * Prevents abuse of storage resources
  */
 export const uploadLimiter = rateLimit({
+  store: new RedisRateLimitStore('upload'), // Shared across API workers when Redis is configured
   windowMs: APP_CONFIG.RATE_LIMIT.UPLOAD_WINDOW,
   max: 50, // 50 uploads per hour
   message: {
@@ -47,6 +50,7 @@ export const uploadLimiter = rateLimit({
  */
 const isDev = process.env.NODE_ENV === 'development';
 export const apiLimiter = rateLimit({
+  store: new RedisRateLimitStore('api'), // Shared across API workers when Redis is configured
   windowMs: APP_CONFIG.RATE_LIMIT.API_WINDOW,
   max: isDev ? 500 : 300, // 500 in dev, 300 per 15 min in production
   message: {
@@ -82,6 +86,7 @@ export const apiLimiter = rateLimit({
  * Prevents spam
  */
 export const contentCreationLimiter = rateLimit({
+  store: new RedisRateLimitStore('content-creation'), // Shared across API workers when Redis is configured
   windowMs: 60 * 60 * 1000, // 1 hour
   max: 100, // 100 content items per hour
   message: {
@@ -28,6 +28,7 @@ import TwitchBitEvent from './TwitchBitEvent.js';
 import TwitchEventSubSubscription from './TwitchEventSubSubscription.js';
 import PublicationMetric from './PublicationMetric.js';
 import Todo from './Todo.js';
+import cacheService from '../services/cacheService.js';
 
 // 👤 User
 const User = sequelize.define('User', {
@@ -125,7 +126,20 @@ const User = sequelize.define('User', {
     type: DataTypes.STRING,
     allowNull: true,
     defaultValue: 'bottom-right',
-    comment: 'Position of floating merchandising button: bottom-right, bottom-left, top-right, top-left'
+    comment: 'Position of floating merchandising button: bottom-right, bottom-left, top-right, top-left, or custom {x, y} stored as JSON text',
+    // Custom {x, y} positions are (de)serialized here once, so API responses carry an object instead of a JSON string
+    get() {
+      const raw = this.getDataValue('merchandisingButtonPosition');
+      if (typeof raw !== 'string' || !raw.startsWith('{')) return raw;
+      try {
+        return JSON.parse(raw);
+      } catch {
+        return raw;
+      }
+    },
+    set(value) {
+      this.setDataValue('merchandisingButtonPosition', value !== null && typeof value === 'object' ? JSON.stringify(value) : value);
+    }
   },
   hasUsedTrial: {
     type: DataTypes.BOOLEAN,
@@ -538,6 +552,22 @@ User.hasMany(NotificationRead, { foreignKey: 'userId', as: 'notificationReads' }
 User.hasMany(PublicationMetric, { foreignKey: 'userId', as: 'publicationMetrics' });
 PublicationMetric.belongsTo(User, { foreignKey: 'userId', as: 'user' });
 
+// 🔐 Auth user cache (middleware/auth.js): drop cached users on every write, including bulk updates
+function invalidateAuthUser(user) {
+  return cacheService.del('AUTH_USER', user.id);
+}
+function invalidateAuthUsersWhere(options) {
+  const id = options?.where?.id;
+  if (typeof id === 'number' || typeof id === 'string') {
+    return cacheService.del('AUTH_USER', id);
+  }
+  return cacheService.invalidatePrefix('AUTH_USER');
+}
+User.addHook('afterSave', invalidateAuthUser);
+User.addHook('afterDestroy', invalidateAuthUser);
+User.addHook('afterBulkUpdate', invalidateAuthUsersWhere);
+User.addHook('afterBulkDestroy', invalidateAuthUsersWhere);
+
 // ⚙️ System Configuration
 const SystemConfig = sequelize.define('SystemConfig', {
   key: {
@@ -1,4 +1,5 @@
 import express from 'express';
+import { once } from 'events';
 import { Content, User } from '../models/index.js';
 import { Op } from 'sequelize';
 import checkLicense from '../middleware/checkLicense.js';
@@ -87,6 +88,89 @@ router.get('/', requireAuth, async (req, res) => {
   }
 });
 
+/** Columns included in the export (selected in SQL so unused columns are never read or hydrated) */
+const EXPORT_ATTRIBUTES = [
+  'id', 'title', 'content', 'contentType', 'scheduledFor', 'status', 'platforms',
+  'hashtags', 'mentions', 'timezone', 'recurrence', 'createdAt', 'updatedAt',
+];
+
+/** Rows fetched per query while streaming the export */
+const EXPORT_BATCH_SIZE = 500;
+
+/**
+ * Wait until res drains or closes; aborting afterwards removes the listener that did not fire.
+ * Returns at once if res is already destroyed (client gone): neither event would fire again.
+ */
+async function waitForDrain(res) {
+  if (res.destroyed || !res.writableNeedDrain) return;
+  const controller = new AbortController();
+  const { signal } = controller;
+  try {
+    await Promise.race([
+      once(res, 'drain', { signal }).catch(() => {}),
+      once(res, 'close', { signal }).catch(() => {}),
+    ]);
+  } finally {
+    controller.abort();
+  }
+}
+
+/**
+ * Export content as a JSON download.
+ * Streams the JSON in batches (keyset on scheduledFor DESC, id DESC) so memory stays flat for large accounts.
+ * Stops as soon as the client disconnects (checked after each query, before writing).
+ */
+export async function exportContentHandler(req, res) {
+  const userId = req.user.id;
+  try {
+    res.setHeader('Content-Type', 'application/json');
+    res.setHeader('Content-Disposition', `attachment; filename="content-export-${new Date().toISOString().split('T')[0]}.json"`);
+    res.write(`{"exportedAt":${JSON.stringify(new Date().toISOString())},"userId":${JSON.stringify(userId)},"contents":[`);
+    
+    let last = null;
+    let totalItems = 0;
+    for (;;) {
+      const where = { userId };
+      if (last) {
+        where[Op.or] = [
+          { scheduledFor: { [Op.lt]: last.scheduledFor } },
+          { scheduledFor: last.scheduledFor, id: { [Op.lt]: last.id } },
+        ];
+      }
+      const batch = await Content.findAll({
+        where,
+        attributes: EXPORT_ATTRIBUTES,
+        order: [['scheduledFor', 'DESC'], ['id', 'DESC']],
+        limit: EXPORT_BATCH_SIZE,
+      });
+      if (res.destroyed || batch.length === 0) break;
+      
+      let chunk = '';
+      for (const c of batch) {
+        chunk += (totalItems === 0 ? '' : ',') + JSON.stringify(c.get({ plain: true }));
+        totalItems++;
+      }
+      if (!res.write(chunk)) {
+        await waitForDrain(res);
+      }
+      if (res.destroyed || batch.length < EXPORT_BATCH_SIZE) break;
+      last = batch[batch.length - 1];
+    }
+    // totalItems follows the array so it always matches the rows actually streamed
+    if (!res.destroyed) res.end(`],"totalItems":${totalItems}}`);
+  } catch (err) {
+    logger.error('Content export failed', { error: err.message, userId });
+    if (res.headersSent) {
+      res.destroy(err);
+      return;
+    }
+    res.status(500).json({ error: 'Export failed', details: err.message });
+  }
+}
+
+// Export content (registered before /:id so "export" is not captured as an id)
+router.get('/export', requireAuth, exportContentHandler);
+
 // Get content by id - allowed without license (read-only)
 router.get('/:id', requireAuth, async (req, res) => {
   try {
@@ -165,43 +249,6 @@ router.delete('/:id', requireAuth, checkLicense, auditLog('content_deleted', 'Co
   }
 });
 
-// Export content
-router.get('/export', async (req, res) => {
-  try {
-    const contents = await Content.findAll({ 
-      where: { userId: req.user.id },
-      order: [['scheduledFor', 'DESC']]
-    });
-    
-    const exportData = {
-      exportedAt: new Date().toISOString(),
-      userId: req.user.id,
-      totalItems: contents.length,
-      contents: contents.map(c => ({
-        id: c.id,
-        title: c.title,
-        content: c.content,
-        contentType: c.contentType,
-        scheduledFor: c.scheduledFor,
-        status: c.status,
-        platforms: c.platforms,
-        hashtags: c.hashtags,
-        mentions: c.mentions,
-        timezone: c.timezone,
-        recurrence: c.recurrence,
-        createdAt: c.createdAt,
-        updatedAt: c.updatedAt
-      }))
-    };
-    
-    res.setHeader('Content-Type', 'application/json');
-    res.setHeader('Content-Disposition', `attachment; filename="content-export-${new Date().toISOString().split('T')[0]}.json"`);
-    res.json(exportData);
-  } catch (err) {
-    res.status(500).json({ error: 'Export failed', details: err.message });
-  }
-});
-
 // Debug endpoint: Check scheduled content and Twitter status
 router.get('/debug-scheduled', requireAuth, async (req, res) => {
   try {
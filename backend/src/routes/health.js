@@ -30,12 +30,15 @@ async function getQueueStatsCached() {
   return value;
 }
 
+/** Liveness body never changes: serialize once instead of on every probe. */
+const LIVE_BODY = JSON.stringify({ status: 'ok' });
+
 /**
  * GET /api/health/live
  * Liveness: process is up. Returns 200 only (for Render, K8s liveness).
  */
 router.get('/live', (req, res) => {
-  res.status(200).json({ status: 'ok' });
+  res.status(200).type('json').send(LIVE_BODY);
 });
 
 /**
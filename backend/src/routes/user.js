@@ -1,6 +1,5 @@
 import { createRequire } from 'module';
 import express from 'express';
-import bcrypt from 'bcryptjs';
 import passport from 'passport';
 import { Strategy as GoogleStrategy } from 'passport-google-oauth20';
 import { Op } from 'sequelize';
@@ -17,7 +16,7 @@ import { refreshIntegrationToken } from '../services/integrationTokenService.js'
 import { generateLicenseKey, generateTemporaryPassword, generateUsernameSuffix } from '../utils/cryptoUtils.js';
 import jwt from 'jsonwebtoken';
 import crypto from 'crypto';
-import { generateAuthData, buildUserResponse, createLinkState, verifyLinkState, createTwitterOAuth2State, verifyTwitterOAuth2State } from '../utils/authUtils.js';
+import { generateAuthData, buildUserResponse, hashPassword, verifyPassword, createLinkState, verifyLinkState, createTwitterOAuth2State, verifyTwitterOAuth2State } from '../utils/authUtils.js';
 import { supabase as supabaseAdmin } from '../utils/supabaseClient.js';
 import { validateBody } from '../middleware/validate.js';
 import {
@@ -1187,7 +1186,7 @@ export async function linkTwitterHandler(req, res) {
 router.post('/register', validateBody(registerSchema), async (req, res) => {
   const { username, email, password, startWithTrial, licenseOption } = req.body;
   try {
-    const hash = await bcrypt.hash(password, 10);
+    const hash = await hashPassword(password);
     
     // Prepare user data
     const userData = { username, email, passwordHash: hash, lastPasswordChange: new Date() };
@@ -1255,7 +1254,7 @@ router.post('/login', validateBody(loginSchema), async (req, res) => {
       return res.status(401).json({ error: 'This account uses OAuth. Please sign in with Google or Twitch.' });
     }
     
-    const valid = await bcrypt.compare(password, user.passwordHash);
+    const valid = await verifyPassword(password, user.passwordHash);
     if (!valid) {
       return res.status(401).json({ error: 'Invalid credentials' });
     }
@@ -1279,6 +1278,16 @@ router.post('/login', validateBody(loginSchema), async (req, res) => {
   }
 });
 
+/**
+ * Attribute computing "column is set" in SQL (non-null, non-empty), so only a boolean is returned instead of the secret.
+ * @param {string} column - User column name
+ * @param {string} alias - Attribute name in the result
+ */
+function isSetAttribute(column, alias) {
+  const quoted = sequelize.getQueryInterface().quoteIdentifier(column);
+  return [sequelize.literal(`(${quoted} IS NOT NULL AND ${quoted} <> '')`), alias];
+}
+
 /** GET /connected-accounts - which OAuth providers and email are linked to the current user. Exported for explicit registration in app.js if needed. */
 export async function connectedAccountsHandler(req, res) {
   const userId = req.user?.id;
@@ -1291,7 +1300,13 @@ export async function connectedAccountsHandler(req, res) {
     }
 
     const user = await User.findByPk(userId, {
-      attributes: ['googleId', 'twitchId', 'discordId', 'twitterId', 'passwordHash', 'oauthProvider', 'oauthId', 'discordAccessToken', 'discordRefreshToken', 'twitterAccessToken'],
+      attributes: [
+        'googleId', 'twitchId', 'discordId', 'twitterId', 'oauthProvider', 'oauthId',
+        // Tokens used below for username lookups; password hash / refresh token only need a presence flag
+        'discordAccessToken', 'twitterAccessToken',
+        isSetAttribute('passwordHash', 'hasPassword'),
+        isSetAttribute('discordRefreshToken', 'hasDiscordRefreshToken'),
+      ],
     });
     if (!user) {
       logger.warn('Connected accounts: User not found', { userId });
@@ -1309,10 +1324,10 @@ export async function connectedAccountsHandler(req, res) {
       hasGoogleId: !!u.googleId,
       hasTwitchId: !!u.twitchId,
       hasDiscordId: !!u.discordId,
-      hasPassword: !!u.passwordHash,
+      hasPassword: !!u.hasPassword,
       oauthProvider: u.oauthProvider,
       oauthId: u.oauthId,
-      hasDiscordToken: !!(u.discordAccessToken || u.discordRefreshToken),
+      hasDiscordToken: !!(u.discordAccessToken || u.hasDiscordRefreshToken),
       hasTwitterToken: !!u.twitterAccessToken,
       hasTwitterId: !!u.twitterId,
       twitterId: u.twitterId,
@@ -1322,7 +1337,7 @@ export async function connectedAccountsHandler(req, res) {
     // Check if Discord is connected: must have discordId AND (discordAccessToken OR discordRefreshToken)
     // This ensures Discord is only shown as connected if it can actually be used (has tokens)
     // Note: oauthProvider === 'discord' alone is not enough - need actual tokens for API calls
-    const discordConnected = !!(u.discordId && (u.discordAccessToken || u.discordRefreshToken));
+    const discordConnected = !!(u.discordId && (u.discordAccessToken || u.hasDiscordRefreshToken));
     const googleConnected = !!(u.googleId || (u.oauthProvider === 'google' && u.oauthId));
     const twitchConnected = !!(u.twitchId || (u.oauthProvider === 'twitch' && u.oauthId));
     // Twitter is connected if has twitterId
@@ -1336,7 +1351,7 @@ export async function connectedAccountsHandler(req, res) {
       twitch: twitchConnected ? { connected: true, username: u.twitchId ? `Twitch User` : null } : { connected: false, username: null },
       discord: discordConnected ? { connected: true, username: null } : { connected: false, username: null },
       twitter: { connected: twitterConnected, username: null },
-      email: { connected: !!u.passwordHash, username: null },
+      email: { connected: !!u.hasPassword, username: null },
     };
 
     // Fetch Twitter username if connected and has token
@@ -1953,7 +1968,7 @@ router.post('/admin/change-email', requireAdmin, validateBody(adminChangeEmailSc
 router.post('/admin/create', requireAdmin, validateBody(adminCreateUserSchema), async (req, res) => {
   const { username, email, password, isAdmin } = req.body;
   try {
-    const hash = await bcrypt.hash(password, 10);
+    const hash = await hashPassword(password);
     const user = await User.create({
       username,
       email,
@@ -2177,7 +2192,7 @@ router.post('/admin/reset-password', requireAdmin, validateBody(adminResetPasswo
     
     // Generate secure temporary password
     const tempPassword = generateTemporaryPassword(12);
-    const hash = await bcrypt.hash(tempPassword, 10);
+    const hash = await hashPassword(tempPassword);
     user.passwordHash = hash;
     user.lastPasswordChange = new Date();
     await user.save();
@@ -2249,7 +2264,7 @@ router.post('/forgot-password', validateBody(forgotPasswordSchema), async (req,
     
     // Generate a secure temporary password
     const tempPassword = generateTemporaryPassword(12);
-    const hash = await bcrypt.hash(tempPassword, 10);
+    const hash = await hashPassword(tempPassword);
     user.passwordHash = hash;
     user.lastPasswordChange = new Date();
     await user.save();
@@ -2663,7 +2678,7 @@ router.put('/profile', requireAuth, validateBody(updateProfileSchema), auditLog(
       if (typeof merchandisingButtonPosition === 'object' && merchandisingButtonPosition !== null && typeof merchandisingButtonPosition.x === 'number' && typeof merchandisingButtonPosition.y === 'number') {
         const x = Math.max(0, Math.min(100, merchandisingButtonPosition.x));
         const y = Math.max(0, Math.min(100, merchandisingButtonPosition.y));
-        user.merchandisingButtonPosition = JSON.stringify({ x, y });
+        user.merchandisingButtonPosition = { x, y };
       } else if (['bottom-right', 'bottom-left', 'top-right', 'top-left'].includes(merchandisingButtonPosition)) {
         user.merchandisingButtonPosition = merchandisingButtonPosition;
       } else if (typeof merchandisingButtonPosition === 'string' && merchandisingButtonPosition.trim().startsWith('{')) {
@@ -2672,7 +2687,7 @@ router.put('/profile', requireAuth, validateBody(updateProfileSchema), auditLog(
           if (parsed && typeof parsed.x === 'number' && typeof parsed.y === 'number') {
             const x = Math.max(0, Math.min(100, parsed.x));
             const y = Math.max(0, Math.min(100, parsed.y));
-            user.merchandisingButtonPosition = JSON.stringify({ x, y });
+            user.merchandisingButtonPosition = { x, y };
           } else {
             user.merchandisingButtonPosition = 'bottom-right';
           }
@@ -2736,10 +2751,10 @@ router.put('/password', requireAuth, validateBody(changePasswordSchema), async (
       return res.status(400).json({ error: 'This account uses OAuth and does not have a password' });
     }
     
-    const valid = await bcrypt.compare(currentPassword, user.passwordHash);
+    const valid = await verifyPassword(currentPassword, user.passwordHash);
     if (!valid) return res.status(401).json({ error: 'Current password is incorrect' });
     
-    const hash = await bcrypt.hash(newPassword, 10);
+    const hash = await hashPassword(newPassword);
     user.passwordHash = hash;
     user.lastPasswordChange = new Date();
     await user.save();
@@ -3,6 +3,7 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import logger from './utils/logger.js';
 import { sequelize } from './models/index.js';
+import { applySqlitePragmas } from './config/database.js';
 import { startScheduler } from './services/scheduler.js';
 import { startSchedulerProducer } from './services/schedulerProducer.js';
 import { runReconciliation } from './services/discordSyncService.js';
@@ -20,6 +21,7 @@ const nodeEnv = process.env.NODE_ENV || 'development';
 async function initDatabase() {
   try {
     await sequelize.authenticate();
+    await applySqlitePragmas();
     const dbType = process.env.DATABASE_URL ? 'PostgreSQL (Supabase)' : 'SQLite';
     logger.info('Scheduler DB connection established', { dbType, environment: nodeEnv });
   } catch (err) {
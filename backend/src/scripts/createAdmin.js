@@ -1,6 +1,6 @@
 import dotenv from 'dotenv';
-import bcrypt from 'bcryptjs';
 import { User, sequelize } from '../models/index.js';
+import { hashPassword } from '../utils/authUtils.js';
 
 dotenv.config();
 
@@ -34,7 +34,7 @@ async function createAdmin() {
         console.log('   Username:', existing.username);
         console.log('   Is Admin:', existing.isAdmin);
         console.log('🔄 Updating password...');
-        const hash = await bcrypt.hash(password, 10);
+        const hash = await hashPassword(password);
         existing.passwordHash = hash;
         existing.lastPasswordChange = new Date();
         await existing.save();
@@ -44,7 +44,7 @@ async function createAdmin() {
         console.log('   Password:', password);
       } else {
         console.log('⚠️  User exists but is not admin. Upgrading to admin...');
-        const hash = await bcrypt.hash(password, 10);
+        const hash = await hashPassword(password);
         await existing.update({ 
           isAdmin: true,
           passwordHash: hash,
@@ -59,7 +59,7 @@ async function createAdmin() {
     }
     
     console.log('👤 Creating new admin user...');
-    const hash = await bcrypt.hash(password, 10);
+    const hash = await hashPassword(password);
     const now = new Date();
     const admin = await User.create({ 
       username, 
@@ -1,6 +1,6 @@
 import dotenv from 'dotenv';
-import bcrypt from 'bcryptjs';
 import { User, sequelize } from '../models/index.js';
+import { hashPassword } from '../utils/authUtils.js';
 
 dotenv.config();
 
@@ -26,7 +26,7 @@ async function resetPassword() {
       console.log(`⚠️  User not found. Creating new user...`);
       // Generate username from email
       const username = email.split('@')[0].replace(/[^a-z0-9]/gi, '').toLowerCase();
-      const hash = await bcrypt.hash(newPassword, 10);
+      const hash = await hashPassword(newPassword);
       user = await User.create({
         username: username,
         email: email,
@@ -39,7 +39,7 @@ async function resetPassword() {
       console.log(`👤 Found user: ${user.username} (${user.email})`);
       console.log('🔄 Resetting password...');
       
-      const hash = await bcrypt.hash(newPassword, 10);
+      const hash = await hashPassword(newPassword);
       user.passwordHash = hash;
       user.lastPasswordChange = new Date();
       await user.save();
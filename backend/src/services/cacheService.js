@@ -6,7 +6,7 @@
  */
 
 import logger from '../utils/logger.js';
-import { getRedis } from '../utils/redisConnection.js';
+import { getCacheRedis } from '../utils/redisConnection.js';
 
 // In-memory cache fallback
 const memoryCache = new Map();
@@ -19,9 +19,37 @@ const CACHE_TTL = {
   PLATFORM_CONFIG: 300,       // 5 minutes
   USER_PROFILE: 300,          // 5 minutes
   CONTENT_LIST: 30,           // 30 seconds
+  AUTH_USER: 60,              // 1 minute (invalidated on every User write)
   DEFAULT: 60,                // 1 minute
 };
 
+// In-process LRU in front of Redis for hot per-request lookups (saves the Redis round-trip).
+// Writes in this process clear it via del/invalidatePrefix; other processes see changes within ttl.
+const LOCAL_CACHE = {
+  AUTH_USER: { ttl: 5, maxSize: 1000 }, // 5 seconds
+};
+const localCache = new Map();
+
+function getLocal(prefix, memKey) {
+  if (!LOCAL_CACHE[prefix]) return null;
+  const entry = localCache.get(memKey);
+  if (!entry) return null;
+  localCache.delete(memKey);
+  if (Date.now() >= entry.expiresAt) return null;
+  localCache.set(memKey, entry); // Re-insert: Map order is the LRU order
+  return entry.value;
+}
+
+function setLocal(prefix, memKey, value) {
+  const config = LOCAL_CACHE[prefix];
+  if (!config) return;
+  localCache.delete(memKey);
+  localCache.set(memKey, { value, expiresAt: Date.now() + config.ttl * 1000 });
+  if (localCache.size > config.maxSize) {
+    localCache.delete(localCache.keys().next().value);
+  }
+}
+
 /**
  * Get cache key with prefix
  */
@@ -34,17 +62,26 @@ function getCacheKey(prefix, key) {
  */
 export async function get(prefix, key) {
   const cacheKey = getCacheKey(prefix, key);
+  const memKey = `${prefix}:${key}`;
+
+  const local = getLocal(prefix, memKey);
+  if (local !== null) {
+    return local;
+  }
   
   try {
-    const redis = await getRedis();
+    const redis = await getCacheRedis();
     if (redis) {
       const value = await redis.get(cacheKey);
       if (value) {
+        let parsed;
         try {
-          return JSON.parse(value);
+          parsed = JSON.parse(value);
         } catch (e) {
-          return value;
+          parsed = value;
         }
+        setLocal(prefix, memKey, parsed);
+        return parsed;
       }
       return null;
     }
@@ -53,7 +90,6 @@ export async function get(prefix, key) {
   }
   
   // Fallback to memory cache
-  const memKey = `${prefix}:${key}`;
   const cached = memoryCache.get(memKey);
   if (cached) {
     const ttl = memoryCacheTTL.get(memKey);
@@ -74,11 +110,13 @@ export async function get(prefix, key) {
 export async function set(prefix, key, value, ttlSeconds = null) {
   const cacheKey = getCacheKey(prefix, key);
   const ttl = ttlSeconds || CACHE_TTL[prefix] || CACHE_TTL.DEFAULT;
+  const memKey = `${prefix}:${key}`;
   
   try {
-    const redis = await getRedis();
+    const redis = await getCacheRedis();
     if (redis) {
       await redis.setex(cacheKey, ttl, JSON.stringify(value));
+      setLocal(prefix, memKey, value);
       return true;
     }
   } catch (error) {
@@ -86,7 +124,6 @@ export async function set(prefix, key, value, ttlSeconds = null) {
   }
   
   // Fallback to memory cache
-  const memKey = `${prefix}:${key}`;
   memoryCache.set(memKey, value);
   memoryCacheTTL.set(memKey, Date.now() + ttl * 1000);
   
@@ -109,9 +146,10 @@ export async function set(prefix, key, value, ttlSeconds = null) {
  */
 export async function del(prefix, key) {
   const cacheKey = getCacheKey(prefix, key);
+  localCache.delete(`${prefix}:${key}`);
   
   try {
-    const redis = await getRedis();
+    const redis = await getCacheRedis();
     if (redis) {
       await redis.del(cacheKey);
     }
@@ -130,7 +168,7 @@ export async function del(prefix, key) {
  */
 export async function invalidatePrefix(prefix) {
   try {
-    const redis = await getRedis();
+    const redis = await getCacheRedis();
     if (redis) {
       const pattern = getCacheKey(prefix, '*');
       const keys = await redis.keys(pattern);
@@ -144,6 +182,11 @@ export async function invalidatePrefix(prefix) {
   
   // Remove from memory cache
   const prefixPattern = `${prefix}:`;
+  for (const key of localCache.keys()) {
+    if (key.startsWith(prefixPattern)) {
+      localCache.delete(key);
+    }
+  }
   for (const key of memoryCache.keys()) {
     if (key.startsWith(prefixPattern)) {
       memoryCache.delete(key);
@@ -17,13 +17,29 @@ function isDiscordEventContent(content) {
   return hasDiscord && (isEvent || !!content.discordGuildId);
 }
 
+/**
+ * Write routes already receive Date objects (Joi date().iso() with convert), so reuse them as-is;
+ * only raw strings such as query filters (dateFrom/dateTo) go through the ISO-8601 parser.
+ */
+function toDate(value) {
+  return value instanceof Date ? value : new Date(value);
+}
+
+/**
+ * Plain row for list responses. Model#toJSON deep-clones every row on res.json();
+ * these instances are discarded after serialization, so the plain getter is enough.
+ */
+function toPlainRow(row) {
+  return row.get({ plain: true });
+}
+
 export class ContentService {
   /**
    * Create content with recurrence support
    */
   async createContent(userId, contentData) {
-    const scheduledFor = new Date(contentData.scheduledFor);
-    const eventEndTime = contentData.eventEndTime ? new Date(contentData.eventEndTime) : null;
+    const scheduledFor = toDate(contentData.scheduledFor);
+    const eventEndTime = contentData.eventEndTime ? toDate(contentData.eventEndTime) : null;
     const occurrences = this.buildOccurrences(scheduledFor, contentData.recurrence);
     
     const { mediaUrls, mediaItems, eventDates, eventLocationUrl, ...restData } = contentData;
@@ -34,26 +50,27 @@ export class ContentService {
       filesData = { items: mediaUrls.map((url) => ({ url })) };
     }
     
-    const created = await Promise.all(
-      occurrences.map((date, index) => {
-        // Calculate eventEndTime for this occurrence if it exists
-        let occurrenceEventEndTime = null;
-        if (eventEndTime) {
-          const timeDiff = eventEndTime.getTime() - scheduledFor.getTime();
-          occurrenceEventEndTime = new Date(date.getTime() + timeDiff);
-        }
-        
-        return Content.create({
-          ...restData,
-          scheduledFor: date,
-          eventEndTime: occurrenceEventEndTime,
-          eventDates: eventDates || null, // Store eventDates array for events with multiple dates
-          eventLocationUrl: eventLocationUrl || null, // Store event location URL (e.g. Twitch link)
-          userId,
-          files: filesData,
-        });
-      })
-    );
+    const rows = occurrences.map((date) => {
+      // Calculate eventEndTime for this occurrence if it exists
+      let occurrenceEventEndTime = null;
+      if (eventEndTime) {
+        const timeDiff = eventEndTime.getTime() - scheduledFor.getTime();
+        occurrenceEventEndTime = new Date(date.getTime() + timeDiff);
+      }
+      
+      return {
+        ...restData,
+        scheduledFor: date,
+        eventEndTime: occurrenceEventEndTime,
+        eventDates: eventDates || null, // Store eventDates array for events with multiple dates
+        eventLocationUrl: eventLocationUrl || null, // Store event location URL (e.g. Twitch link)
+        userId,
+        files: filesData,
+      };
+    });
+
+    // One multi-row INSERT for all occurrences (recurrence can create up to 50) instead of one INSERT each
+    const created = await Content.bulkCreate(rows, { validate: true });
     
     logger.info('Content created via service', {
       userId,
@@ -94,10 +111,10 @@ export class ContentService {
     if (options.dateFrom || options.dateTo) {
       where.scheduledFor = {};
       if (options.dateFrom) {
-        where.scheduledFor[Op.gte] = new Date(options.dateFrom);
+        where.scheduledFor[Op.gte] = toDate(options.dateFrom);
       }
       if (options.dateTo) {
-        where.scheduledFor[Op.lte] = new Date(options.dateTo);
+        where.scheduledFor[Op.lte] = toDate(options.dateTo);
       }
     }
     
@@ -118,7 +135,7 @@ export class ContentService {
 
     try {
       const { count, rows } = await Content.findAndCountAll(findOptions);
-      return formatPaginatedResponse(rows, count, page, limit);
+      return formatPaginatedResponse(rows.map(toPlainRow), count, page, limit);
     } catch (err) {
       const msg = (err && err.message) || '';
       // If deletedAt column does not exist (migration not run), retry without it and exclude from SELECT
@@ -130,7 +147,7 @@ export class ContentService {
           where,
           attributes: { exclude: ['deletedAt'] },
         });
-        return formatPaginatedResponse(rows, count, page, limit);
+        return formatPaginatedResponse(rows.map(toPlainRow), count, page, limit);
       }
       throw err;
     }
@@ -191,19 +208,37 @@ export class ContentService {
 
   /**
    * Delete content. If it has a Discord event, soft-delete and enqueue sync to remove event on Discord.
+   * Runs as DELETE/UPDATE ... WHERE (no prior SELECT); affected row counts detect not-found.
    */
   async deleteContent(contentId, userId) {
-    const content = await this.getContentById(contentId, userId);
-    if (content.discordEventId && content.discordGuildId) {
-      await content.update({ deletedAt: new Date() });
-      enqueueDiscordSync(contentId).catch((err) =>
-        logger.warn('Enqueue Discord sync after delete failed', { contentId, error: err.message })
-      );
-      logger.info('Content soft-deleted (Discord sync enqueued)', { userId, contentId });
-    } else {
-      await content.destroy();
+    const where = { id: contentId, userId, deletedAt: null };
+
+    // Common case: no Discord event attached -> hard delete in one statement
+    const deleted = await Content.destroy({
+      where: {
+        ...where,
+        [Op.or]: [
+          { discordEventId: null },
+          { discordEventId: '' },
+          { discordGuildId: null },
+          { discordGuildId: '' },
+        ],
+      },
+    });
+    if (deleted > 0) {
       logger.info('Content deleted via service', { userId, contentId });
+      return { message: 'Content deleted successfully' };
+    }
+
+    // Discord event attached: soft-delete so the sync worker can remove the event on Discord
+    const [softDeleted] = await Content.update({ deletedAt: new Date() }, { where });
+    if (softDeleted === 0) {
+      throw new Error('Content not found');
     }
+    enqueueDiscordSync(contentId).catch((err) =>
+      logger.warn('Enqueue Discord sync after delete failed', { contentId, error: err.message })
+    );
+    logger.info('Content soft-deleted (Discord sync enqueued)', { userId, contentId });
     return { message: 'Content deleted successfully' };
   }
 
@@ -103,7 +103,7 @@ export async function processSync(contentId) {
 
   const guildId = content.discordGuildId;
   const isEvent = (content.contentType || '').trim().toLowerCase() === 'event';
-  const hasDiscord = Array.isArray(content.platforms) && content.platforms.map((p) => (p || '').trim().toLowerCase()).includes('discord');
+  const hasDiscord = Array.isArray(content.platforms) && content.platforms.some((p) => (p || '').trim().toLowerCase() === 'discord');
 
   if (!guildId || (!isEvent && !hasDiscord)) {
     logger.debug('Discord sync: skip (not event or no guild)', { contentId, contentType: content.contentType, guildId });
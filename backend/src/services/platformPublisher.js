@@ -46,6 +46,168 @@ async function getAccessToken(userId, platform) {
   };
 }
 
+/**
+ * Discord: events go through the versioned sync queue, messages are posted directly
+ */
+async function publishDiscord({ content, mediaItems }) {
+  const contentType = (content.contentType || '').trim().toLowerCase();
+
+  if (contentType === 'event') {
+    // Events: use Discord sync queue (versioned, rate-limited)
+    if (!content.discordGuildId) {
+      throw new Error('discordGuildId is required for Discord events');
+    }
+    await enqueueDiscordSync(content.id);
+    return {
+      externalId: content.discordEventId || null,
+      metadata: { discordGuildId: content.discordGuildId },
+    };
+  }
+
+  // Messages: publish directly
+  if (!content.discordChannelId) {
+    throw new Error('discordChannelId is required for Discord messages');
+  }
+
+  const formatted = formatDiscordContent(content);
+  let message;
+
+  if (mediaItems.length > 0) {
+    message = await postToDiscordChannelWithAttachments(
+      content.discordChannelId,
+      formatted,
+      mediaItems
+    );
+  } else {
+    message = await postToDiscordChannel(
+      content.discordChannelId,
+      formatted
+    );
+  }
+
+  return {
+    externalId: message.id,
+    metadata: {
+      channelId: content.discordChannelId,
+      messageId: message.id,
+    },
+  };
+}
+
+/**
+ * Twitter: publish tweet
+ */
+async function publishTwitter({ content, accessToken }) {
+  const formatted = formatTwitterContent(content);
+  const tweet = await postTweet(accessToken, formatted);
+  const externalId = tweet.data?.id || tweet.id;
+  return {
+    externalId,
+    metadata: {
+      tweetId: externalId,
+      url: `https://twitter.com/i/web/status/${externalId}`,
+    },
+  };
+}
+
+/**
+ * Twitch: create schedule segment (events) or update channel title
+ */
+async function publishTwitch({ content, accessToken, providerUserId }) {
+  const twitchService = new TwitchService();
+  const contentType = (content.contentType || '').trim().toLowerCase();
+
+  if (contentType === 'event') {
+    // Create schedule segment (adds event to Twitch calendar)
+    if (content.twitchSegmentId) {
+      return {
+        externalId: content.twitchSegmentId,
+        metadata: { segmentId: content.twitchSegmentId },
+      };
+    }
+
+    let duration = 120;
+    const startTime = content.scheduledFor;
+    if (content.eventEndTime) {
+      const start = new Date(startTime).getTime();
+      const end = new Date(content.eventEndTime).getTime();
+      duration = Math.max(60, Math.round((end - start) / 60000));
+    } else if (content.eventDates?.length > 0) {
+      const first = content.eventDates[0];
+      const last = content.eventDates[content.eventDates.length - 1];
+      const start = new Date(`${first.date}T${first.time}`).getTime();
+      const end = (last.endDate && last.endTime)
+        ? new Date(`${last.endDate}T${last.endTime}`).getTime()
+        : start + 120 * 60000;
+      duration = Math.max(60, Math.round((end - start) / 60000));
+    }
+    const categoryId = content.twitchCategoryId
+      || await twitchService.getGameId(accessToken, 'Just Chatting');
+    const twitchResult = await twitchService.createScheduleSegment({
+      userAccessToken: accessToken,
+      broadcasterId: providerUserId,
+      startTime,
+      timezone: content.timezone || 'UTC',
+      duration,
+      title: (content.title || 'Scheduled Stream').slice(0, 140),
+      categoryId,
+    });
+    if (twitchResult.segmentId) {
+      await Content.update(
+        { twitchSegmentId: twitchResult.segmentId },
+        { where: { id: content.id } }
+      );
+    }
+    return {
+      externalId: twitchResult.segmentId,
+      metadata: { segmentId: twitchResult.segmentId },
+    };
+  }
+
+  // Update channel title
+  const formatted = formatTwitchContent(content);
+  const title = (formatted?.title || formatted?.split?.('\n\n')?.[0]?.trim?.() || content.title || 'Stream').slice(0, 140);
+  await twitchService.updateChannelInfo({
+    userAccessToken: accessToken,
+    broadcasterId: providerUserId,
+    title,
+  });
+  return {
+    externalId: providerUserId,
+    metadata: { channelId: providerUserId },
+  };
+}
+
+/**
+ * YouTube: upload video
+ */
+async function publishYouTube({ content, accessToken, mediaItems }) {
+  if (mediaItems.length === 0 || mediaItems[0].type !== 'video') {
+    throw new Error('YouTube requires a video file');
+  }
+  const formatted = formatYouTubeContent(content);
+  const video = await uploadVideoToYouTube(
+    accessToken,
+    mediaItems[0].url,
+    formatted
+  );
+  return {
+    externalId: video.id,
+    metadata: {
+      videoId: video.id,
+      url: `https://youtube.com/watch?v=${video.id}`,
+    },
+  };
+}
+
+/** Publisher per platform (single lookup instead of an if/else chain per job) */
+const PLATFORM_PUBLISHERS = {
+  discord: publishDiscord,
+  twitter: publishTwitter,
+  twitch: publishTwitch,
+  youtube: publishYouTube,
+};
+
 /**
  * Publish content to a specific platform
  * @param {Content} content - Content instance
@@ -76,134 +238,11 @@ export async function publishToPlatform(content, platform, user) {
     // Resolve media URLs
     const mediaItems = await resolveMediaUrls(content.files || []);
 
-    let result = { externalId: null, metadata: {} };
-
-    if (platform === 'discord') {
-      // Discord: Check if event or message
-      const contentType = (content.contentType || '').trim().toLowerCase();
-      
-      if (contentType === 'event') {
-        // Events: use Discord sync queue (versioned, rate-limited)
-        if (!content.discordGuildId) {
-          throw new Error('discordGuildId is required for Discord events');
-        }
-        await enqueueDiscordSync(content.id);
-        result.externalId = content.discordEventId || null;
-        result.metadata = { discordGuildId: content.discordGuildId };
-      } else {
-        // Messages: publish directly
-        if (!content.discordChannelId) {
-          throw new Error('discordChannelId is required for Discord messages');
-        }
-        
-        const formatted = formatDiscordContent(content);
-        let message;
-        
-        if (mediaItems.length > 0) {
-          message = await postToDiscordChannelWithAttachments(
-            content.discordChannelId,
-            formatted,
-            mediaItems
-          );
-        } else {
-          message = await postToDiscordChannel(
-            content.discordChannelId,
-            formatted
-          );
-        }
-        
-        result.externalId = message.id;
-        result.metadata = {
-          channelId: content.discordChannelId,
-          messageId: message.id,
-        };
-      }
-    } else if (platform === 'twitter') {
-      // Twitter: publish tweet
-      const formatted = formatTwitterContent(content);
-      const tweet = await postTweet(accessToken, formatted);
-      result.externalId = tweet.data?.id || tweet.id;
-      result.metadata = {
-        tweetId: result.externalId,
-        url: `https://twitter.com/i/web/status/${result.externalId}`,
-      };
-    } else if (platform === 'twitch') {
-      // Twitch: create schedule segment or update channel
-      const twitchService = new TwitchService();
-      const contentType = (content.contentType || '').trim().toLowerCase();
-      
-      if (contentType === 'event') {
-        // Create schedule segment (adds event to Twitch calendar)
-        if (!content.twitchSegmentId) {
-          let duration = 120;
-          const startTime = content.scheduledFor;
-          if (content.eventEndTime) {
-            const start = new Date(startTime).getTime();
-            const end = new Date(content.eventEndTime).getTime();
-            duration = Math.max(60, Math.round((end - start) / 60000));
-          } else if (content.eventDates?.length > 0) {
-            const first = content.eventDates[0];
-            const last = content.eventDates[content.eventDates.length - 1];
-            const start = new Date(`${first.date}T${first.time}`).getTime();
-            const end = (last.endDate && last.endTime)
-              ? new Date(`${last.endDate}T${last.endTime}`).getTime()
-              : start + 120 * 60000;
-            duration = Math.max(60, Math.round((end - start) / 60000));
-          }
-          const categoryId = content.twitchCategoryId
-            || await twitchService.getGameId(accessToken, 'Just Chatting');
-          const twitchResult = await twitchService.createScheduleSegment({
-            userAccessToken: accessToken,
-            broadcasterId: providerUserId,
-            startTime,
-            timezone: content.timezone || 'UTC',
-            duration,
-            title: (content.title || 'Scheduled Stream').slice(0, 140),
-            categoryId,
-          });
-          result.externalId = twitchResult.segmentId;
-          result.metadata = { segmentId: twitchResult.segmentId };
-          if (twitchResult.segmentId) {
-            await Content.update(
-              { twitchSegmentId: twitchResult.segmentId },
-              { where: { id: content.id } }
-            );
-          }
-        } else {
-          result.externalId = content.twitchSegmentId;
-          result.metadata = { segmentId: content.twitchSegmentId };
-        }
-      } else {
-        // Update channel title
-        const formatted = formatTwitchContent(content);
-        const title = (formatted?.title || formatted?.split?.('\n\n')?.[0]?.trim?.() || content.title || 'Stream').slice(0, 140);
-        await twitchService.updateChannelInfo({
-          userAccessToken: accessToken,
-          broadcasterId: providerUserId,
-          title,
-        });
-        result.externalId = providerUserId;
-        result.metadata = { channelId: providerUserId };
-      }
-    } else if (platform === 'youtube') {
-      // YouTube: upload video
-      if (mediaItems.length === 0 || !mediaItems[0].type === 'video') {
-        throw new Error('YouTube requires a video file');
-      }
-      const formatted = formatYouTubeContent(content);
-      const video = await uploadVideoToYouTube(
-        accessToken,
-        mediaItems[0].url,
-        formatted
-      );
-      result.externalId = video.id;
-      result.metadata = {
-        videoId: video.id,
-        url: `https://youtube.com/watch?v=${video.id}`,
-      };
-    } else {
+    const publish = Object.hasOwn(PLATFORM_PUBLISHERS, platform) ? PLATFORM_PUBLISHERS[platform] : null;
+    if (!publish) {
       throw new Error(`Platform ${platform} not implemented`);
     }
+    const result = await publish({ content, accessToken, providerUserId, mediaItems });
 
     const duration = Date.now() - startTime;
     logger.info('Publication successful', {
@@ -37,7 +37,7 @@ function calculateNextRetry(retryCount) {
 async function handlePublicationJob(jobData) {
   const { contentId, platform, contentPlatformId } = jobData;
   
-  // Load ContentPlatform (create if doesn't exist)
+  // Load ContentPlatform together with its Content (one query instead of reloading both)
   let contentPlatform = null;
   if (contentPlatformId) {
     contentPlatform = await ContentPlatform.findByPk(contentPlatformId, {
@@ -45,17 +45,14 @@ async function handlePublicationJob(jobData) {
     });
   }
   
-  // Load Content first
-  const content = await Content.findByPk(contentId);
+  const content = contentPlatform?.content && String(contentPlatform.content.id) === String(contentId)
+    ? contentPlatform.content
+    : await Content.findByPk(contentId);
   if (!content) {
     throw new Error(`Content ${contentId} not found`);
   }
   
-  // Load or create ContentPlatform
-  if (contentPlatformId) {
-    contentPlatform = await ContentPlatform.findByPk(contentPlatformId);
-  }
-  
+  // Create ContentPlatform if the job did not reference an existing one
   if (!contentPlatform) {
     // Check if ContentPlatform already exists
     contentPlatform = await ContentPlatform.findOne({
@@ -29,6 +29,8 @@ import platformConfigService from './platformConfigService.js';
 
 const INTERVAL_MS = APP_CONFIG.SCHEDULER_INTERVAL_MS;
 const SIGNED_URL_EXPIRES_SEC = APP_CONFIG.SIGNED_URL_EXPIRES_SEC;
+/** Path mentions "video" anywhere or ends in a video extension (one case-insensitive scan) */
+const VIDEO_PATH_PATTERN = /video|\.(mp4|webm|mov|avi)$/i;
 
 /**
  * Resolve media items to have a usable url. Prefer file_path (fresh signed URL from Supabase) over stored url (often expired).
@@ -39,7 +41,7 @@ export function inferBucket(item) {
   if (item.type === 'video') return 'videos';
   if (item.type === 'image') return 'images';
   const path = item.file_path || item.url || '';
-  if (String(path).toLowerCase().includes('video') || /\.(mp4|webm|mov|avi)$/i.test(path)) return 'videos';
+  if (VIDEO_PATH_PATTERN.test(path)) return 'videos';
   return 'images';
 }
 
@@ -338,7 +340,7 @@ async function publishToPlatform(content, platform) {
       // YouTube video upload
       const rawItems = content.files?.items ?? (content.files?.urls ? content.files.urls.map((u) => ({ url: u })) : []) ?? [];
       const videoItems = rawItems.filter(item => {
-        const type = item.type || (String(item.url || item.file_path || '').toLowerCase().includes('video') ? 'video' : 'image');
+        const type = item.type || (/video/i.test(String(item.url || item.file_path || '')) ? 'video' : 'image');
         return type === 'video';
       });
 
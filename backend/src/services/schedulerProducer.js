@@ -68,15 +68,16 @@ async function getDueContent() {
 }
 
 /**
- * Ensure ContentPlatform entries exist for all platforms in Content.platforms
+ * Ensure ContentPlatform entries exist for all platforms in Content.platforms.
+ * Uses the contentPlatforms eager-loaded by getDueContent; only queries when the association was not included.
  */
 async function ensureContentPlatforms(content) {
   const platforms = Array.isArray(content.platforms) ? content.platforms : [];
   
-  // Load existing ContentPlatform entries
-  const existingPlatforms = await ContentPlatform.findAll({
-    where: { contentId: content.id },
-  });
+  // Existing ContentPlatform entries (avoid one extra SELECT per due content item)
+  const existingPlatforms = Array.isArray(content.contentPlatforms)
+    ? content.contentPlatforms
+    : await ContentPlatform.findAll({ where: { contentId: content.id } });
   
   const platformMap = new Map();
   existingPlatforms.forEach(cp => {
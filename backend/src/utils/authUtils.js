@@ -5,7 +5,9 @@
  */
 
 import jwt from 'jsonwebtoken';
+import bcrypt from 'bcryptjs';
 import { buildLicenseSummary } from './licenseUtils.js';
+import { APP_CONFIG } from '../constants/app.js';
 
 const jwtSecret = process.env.JWT_SECRET || 'dev-jwt-secret';
 const JWT_EXPIRY = process.env.JWT_EXPIRY || '7d';
@@ -71,6 +73,27 @@ export function verifyTwitterOAuth2State(stateToken, purpose) {
   }
 }
 
+/**
+ * Hash a password with bcrypt (single place for the cost factor)
+ * @param {string} password - Plain password
+ * @returns {Promise<string>} bcrypt hash
+ */
+export function hashPassword(password) {
+  return bcrypt.hash(password, APP_CONFIG.BCRYPT_ROUNDS);
+}
+
+/**
+ * Verify a password against a stored bcrypt hash.
+ * Only called on login/password change; authenticated requests use the JWT and never re-verify.
+ * @param {string} password - Plain password
+ * @param {string|null} passwordHash - Stored hash (null for OAuth-only users)
+ * @returns {Promise<boolean>}
+ */
+export function verifyPassword(password, passwordHash) {
+  if (!passwordHash) return Promise.resolve(false);
+  return bcrypt.compare(password, passwordHash);
+}
+
 /**
  * Generate JWT token for a user
  * @param {Object} user - User object with id, email, username, isAdmin
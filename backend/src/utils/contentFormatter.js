@@ -281,6 +281,11 @@ export function formatTwitchContent(content) {
   return parts.join('\n\n').trim() || '';
 }
 
+/** Title markers that mean the prefix is already present (case-insensitive, no lowercased copy of the title) */
+const YOUTUBE_STREAM_MARKER = /stream|live|🔴/i;
+const YOUTUBE_EVENT_MARKER = /event|📅/i;
+const YOUTUBE_REEL_MARKER = /reel|🎬/i;
+
 /**
  * Format YouTube video title and description based on contentType
  */
@@ -293,20 +298,17 @@ export function formatYouTubeContent(content) {
   // Add type prefix/formatting to title based on contentType
   if (contentType === 'stream') {
     // For streams, add live indicator if not present
-    const lowerTitle = videoTitle.toLowerCase();
-    if (!lowerTitle.includes('stream') && !lowerTitle.includes('live') && !lowerTitle.includes('🔴')) {
+    if (!YOUTUBE_STREAM_MARKER.test(videoTitle)) {
       videoTitle = `🔴 LIVE: ${videoTitle}`;
     }
   } else if (contentType === 'event') {
     // For events, add event indicator
-    const lowerTitle = videoTitle.toLowerCase();
-    if (!lowerTitle.includes('event') && !lowerTitle.includes('📅')) {
+    if (!YOUTUBE_EVENT_MARKER.test(videoTitle)) {
       videoTitle = `📅 ${videoTitle}`;
     }
   } else if (contentType === 'reel') {
     // For reels, add reel indicator
-    const lowerTitle = videoTitle.toLowerCase();
-    if (!lowerTitle.includes('reel') && !lowerTitle.includes('🎬')) {
+    if (!YOUTUBE_REEL_MARKER.test(videoTitle)) {
       videoTitle = `🎬 ${videoTitle}`;
     }
   }
@@ -172,7 +172,7 @@ export async function postToDiscordChannelWithAttachments(channelId, content, it
     const item = slice[i];
     const url = typeof item === 'string' ? item : item?.url;
     if (!url || typeof url !== 'string') continue;
-    const type = (typeof item === 'object' && item?.type) || (String(url).toLowerCase().includes('video') ? 'video' : 'image');
+    const type = (typeof item === 'object' && item?.type) || (/video/i.test(url) ? 'video' : 'image');
     const maxSize = type === 'video' ? MAX_VIDEO_SIZE_BYTES : MAX_IMAGE_SIZE_BYTES;
     logger.info('Discord publish: fetching attachment', { index: i, type });
     try {
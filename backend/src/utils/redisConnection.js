@@ -60,6 +60,43 @@ export async function getRedis() {
   }
 }
 
+let cacheRedis = null;
+
+/**
+ * Options for the cache client: fail fast instead of queueing while Redis is down, so callers
+ * (cacheService, on the auth path and in User hooks) fall back instead of hanging.
+ */
+const CACHE_REDIS_OPTIONS = {
+  enableReadyCheck: false,
+  enableOfflineQueue: false,
+  maxRetriesPerRequest: 1,
+  commandTimeout: 500,
+};
+
+/**
+ * Get dedicated Redis client for cacheService. Null if Redis not configured.
+ * Separate from getRedis(): the shared client uses maxRetriesPerRequest: null (BullMQ),
+ * which queues commands indefinitely while disconnected.
+ */
+export async function getCacheRedis() {
+  if (cacheRedis) return cacheRedis;
+  const config = getRedisConfig();
+  if (!config) return null;
+  try {
+    const IORedis = (await import('ioredis')).default;
+    cacheRedis = config.url
+      ? new IORedis(config.url, CACHE_REDIS_OPTIONS)
+      : new IORedis({ ...config, ...CACHE_REDIS_OPTIONS });
+    cacheRedis.on('error', (err) => {
+      logger.debug('Redis cache connection error', { error: err?.message || err });
+    });
+    return cacheRedis;
+  } catch (err) {
+    logger.warn('Redis not available', { error: err.message });
+    return null;
+  }
+}
+
 /**
  * Get connection config for BullMQ (url or host/port + Upstash-compatible options).
  */
@@ -0,0 +1,85 @@
+/**
+ * Redis store for express-rate-limit
+ * Shares hit counters across API processes (WEB_CONCURRENCY > 1) so limits apply per client, not per worker.
+ * Uses the fail-fast cache client; falls back to a per-process MemoryStore if Redis is not configured or errors.
+ * Copyright © 2024-2026 Christian David Villar Colodro. All rights reserved.
+ */
+
+import { MemoryStore } from 'express-rate-limit';
+import logger from './logger.js';
+import { getCacheRedis } from './redisConnection.js';
+
+export class RedisRateLimitStore {
+  /**
+   * @param {string} name - Limiter name, used in the Redis key prefix (one store per limiter)
+   */
+  constructor(name) {
+    this.prefix = `ratelimit:http:${name}:`;
+    this.localKeys = false;
+    this.memory = new MemoryStore();
+  }
+
+  /**
+   * Called by express-rate-limit with the limiter options
+   */
+  init(options) {
+    this.windowMs = options.windowMs;
+    this.memory.init(options);
+  }
+
+  /**
+   * Count a hit; the window starts with the first hit for the key
+   */
+  async increment(key) {
+    const redis = await getCacheRedis();
+    if (redis) {
+      const redisKey = this.prefix + key;
+      try {
+        const [[incrErr, totalHits], [ttlErr, ttl]] = await redis.multi().incr(redisKey).pttl(redisKey).exec();
+        if (incrErr || ttlErr) throw incrErr || ttlErr;
+        let resetMs = ttl;
+        if (ttl < 0) {
+          await redis.pexpire(redisKey, this.windowMs);
+          resetMs = this.windowMs;
+        }
+        return { totalHits, resetTime: new Date(Date.now() + resetMs) };
+      } catch (error) {
+        logger.warn('Redis rate limit increment error, using memory store', { key: redisKey, error: error.message });
+      }
+    }
+    return this.memory.increment(key);
+  }
+
+  /**
+   * Undo a hit (skipSuccessfulRequests / skipFailedRequests)
+   */
+  async decrement(key) {
+    const redis = await getCacheRedis();
+    if (redis) {
+      try {
+        await redis.decr(this.prefix + key);
+        return;
+      } catch (error) {
+        logger.warn('Redis rate limit decrement error', { key: this.prefix + key, error: error.message });
+      }
+    }
+    await this.memory.decrement(key);
+  }
+
+  /**
+   * Reset a client's counter
+   */
+  async resetKey(key) {
+    const redis = await getCacheRedis();
+    if (redis) {
+      try {
+        await redis.del(this.prefix + key);
+      } catch (error) {
+        logger.warn('Redis rate limit reset error', { key: this.prefix + key, error: error.message });
+      }
+    }
+    await this.memory.resetKey(key);
+  }
+}
+
+export default RedisRateLimitStore;
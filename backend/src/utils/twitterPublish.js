@@ -7,6 +7,8 @@ import logger from './logger.js';
 import { TWITTER_MAX_CHARS } from '../constants/platforms.js';
 
 const X_API_TWEETS = 'https://api.x.com/2/tweets';
+/** X API error messages that indicate missing app permissions or a revoked token */
+const PERMISSION_ERROR_PATTERN = /forbidden|insufficient|permission|unauthorized/i;
 
 /**
  * Post a tweet with the given text.
@@ -61,11 +63,7 @@ export async function postTweet(accessToken, text) {
         errMsg = 'X (Twitter) API: No credits left. Your Developer account has no posting credits. Check the Twitter Developer Portal (Billing / Usage) and upgrade your plan if needed.';
       }
       // Check for common permission errors
-      const errorStr = String(errMsg).toLowerCase();
-      if (errorStr.includes('forbidden') || 
-          errorStr.includes('insufficient') || 
-          errorStr.includes('permission') ||
-          errorStr.includes('unauthorized') ||
+      if (PERMISSION_ERROR_PATTERN.test(String(errMsg)) ||
           res.status === 403 ||
           res.status === 401) {
         isPermissionError = true;
@@ -3,6 +3,7 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import logger from './utils/logger.js';
 import { sequelize } from './models/index.js';
+import { applySqlitePragmas } from './config/database.js';
 import { startWorker } from './services/publicationWorker.js';
 import { startDiscordSyncWorker } from './services/discordQueueService.js';
 import { startDiscordGateway } from './services/discordGatewayService.js';
@@ -18,6 +19,7 @@ const nodeEnv = process.env.NODE_ENV || 'development';
 async function initDatabase() {
   try {
     await sequelize.authenticate();
+    await applySqlitePragmas();
     const dbType = process.env.DATABASE_URL ? 'PostgreSQL (Supabase)' : 'SQLite';
     logger.info('Worker DB connection established', { dbType, environment: nodeEnv });
   } catch (err) {
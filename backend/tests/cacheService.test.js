@@ -0,0 +1,92 @@
+/**
+ * Cache Service Tests
+ * In-process LRU tier in front of Redis (LOCAL_CACHE prefixes)
+ * Copyright © 2024-2026 Christian David Villar Colodro. All rights reserved.
+ *
+ * Run with: npm test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+// Map-backed stand-in for the Redis client so the local tier is exercised on the Redis path
+const redisStore = new Map();
+const fakeRedis = {
+  get: async (key) => redisStore.get(key) ?? null,
+  setex: async (key, ttl, value) => { redisStore.set(key, value); },
+  del: async (...keys) => { keys.forEach((k) => redisStore.delete(k)); },
+  keys: async (pattern) => [...redisStore.keys()].filter((k) => k.startsWith(pattern.replace('*', ''))),
+};
+
+vi.mock('../src/utils/redisConnection.js', () => ({
+  getCacheRedis: async () => fakeRedis,
+}));
+
+const { get, set, del, invalidatePrefix } = await import('../src/services/cacheService.js');
+
+describe('CacheService local tier', () => {
+  beforeEach(async () => {
+    vi.useFakeTimers();
+    await invalidatePrefix('AUTH_USER');
+    redisStore.clear();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('should serve AUTH_USER from the local tier without Redis', async () => {
+    await set('AUTH_USER', 1, { id: 1 });
+    redisStore.clear();
+
+    expect(await get('AUTH_USER', 1)).toEqual({ id: 1 });
+  });
+
+  it('should expire local entries after their TTL', async () => {
+    await set('AUTH_USER', 1, { id: 1 });
+    redisStore.clear();
+
+    vi.advanceTimersByTime(4000);
+    expect(await get('AUTH_USER', 1)).toEqual({ id: 1 });
+
+    vi.advanceTimersByTime(1000);
+    expect(await get('AUTH_USER', 1)).toBeNull();
+  });
+
+  it('should evict the least recently used entry at maxSize', async () => {
+    for (let id = 0; id < 1000; id++) {
+      await set('AUTH_USER', id, { id });
+    }
+    // Touch 0 so 1 becomes the least recently used entry
+    await get('AUTH_USER', 0);
+    await set('AUTH_USER', 1000, { id: 1000 });
+    redisStore.clear();
+
+    expect(await get('AUTH_USER', 0)).toEqual({ id: 0 });
+    expect(await get('AUTH_USER', 1)).toBeNull();
+    expect(await get('AUTH_USER', 2)).toEqual({ id: 2 });
+    expect(await get('AUTH_USER', 1000)).toEqual({ id: 1000 });
+  });
+
+  it('should clear the local tier on del', async () => {
+    await set('AUTH_USER', 1, { id: 1 });
+    await del('AUTH_USER', 1);
+
+    expect(await get('AUTH_USER', 1)).toBeNull();
+  });
+
+  it('should clear the local tier on invalidatePrefix', async () => {
+    await set('AUTH_USER', 1, { id: 1 });
+    await set('AUTH_USER', 2, { id: 2 });
+    await invalidatePrefix('AUTH_USER');
+
+    expect(await get('AUTH_USER', 1)).toBeNull();
+    expect(await get('AUTH_USER', 2)).toBeNull();
+  });
+
+  it('should not keep other prefixes in the local tier', async () => {
+    await set('TEMPLATES', 1, { id: 1 });
+    redisStore.clear();
+
+    expect(await get('TEMPLATES', 1)).toBeNull();
+  });
+});
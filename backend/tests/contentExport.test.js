@@ -0,0 +1,88 @@
+/**
+ * Content Export Tests
+ * Streaming GET /api/content/export handler
+ * Copyright © 2024-2026 Christian David Villar Colodro. All rights reserved.
+ *
+ * Run with: npm test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import http from 'http';
+import { once } from 'events';
+import express from 'express';
+import { Content } from '../src/models/index.js';
+import { exportContentHandler } from '../src/routes/content.js';
+
+function fakeRow(id) {
+  const row = { id, title: `Item ${id}`, content: 'x'.repeat(200), scheduledFor: new Date(Date.UTC(2026, 0, 1) - id * 1000) };
+  return { ...row, get: () => row };
+}
+
+describe('exportContentHandler', () => {
+  let server;
+  let baseUrl;
+  let handlerDone;
+  let serverRes;
+
+  beforeEach(async () => {
+    const app = express();
+    app.get('/export', (req, res) => {
+      req.user = { id: 1 };
+      serverRes = res;
+      handlerDone = exportContentHandler(req, res);
+    });
+    server = http.createServer(app);
+    server.listen(0);
+    await once(server, 'listening');
+    baseUrl = `http://127.0.0.1:${server.address().port}`;
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    server.closeAllConnections?.();
+    await new Promise((resolve) => server.close(resolve));
+  });
+
+  it('should stream all rows followed by totalItems', async () => {
+    vi.spyOn(Content, 'findAll').mockResolvedValueOnce([fakeRow(1), fakeRow(2)]);
+
+    const body = await new Promise((resolve, reject) => {
+      http.get(`${baseUrl}/export`, (res) => {
+        let data = '';
+        res.setEncoding('utf8');
+        res.on('data', (chunk) => { data += chunk; });
+        res.on('end', () => resolve(data));
+      }).on('error', reject);
+    });
+    await handlerDone;
+
+    const parsed = JSON.parse(body);
+    expect(parsed.userId).toBe(1);
+    expect(parsed.contents.map((c) => c.id)).toEqual([1, 2]);
+    expect(parsed.totalItems).toBe(2);
+    expect(Content.findAll).toHaveBeenCalledTimes(1);
+  });
+
+  it('should return when the client disconnects during a batch query', async () => {
+    let resolveBatch;
+    vi.spyOn(Content, 'findAll').mockImplementation(
+      () => new Promise((resolve) => { resolveBatch = resolve; }),
+    );
+
+    const clientReq = http.get(`${baseUrl}/export`);
+    clientReq.on('error', () => {});
+    await once(clientReq, 'response');
+
+    // Client goes away while the query is pending
+    clientReq.destroy();
+    await once(serverRes, 'close');
+    resolveBatch(Array.from({ length: 500 }, (_, i) => fakeRow(i + 1)));
+
+    const result = await Promise.race([
+      handlerDone.then(() => 'returned'),
+      new Promise((resolve) => setTimeout(() => resolve('timeout'), 2000)),
+    ]);
+    expect(result).toBe('returned');
+    expect(Content.findAll).toHaveBeenCalledTimes(1);
+  });
+});
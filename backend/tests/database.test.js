@@ -0,0 +1,44 @@
+/**
+ * Database Configuration Tests
+ * SQLite pragmas applied by applySqlitePragmas
+ * Copyright © 2024-2026 Christian David Villar Colodro. All rights reserved.
+ *
+ * Run with: npm test
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { QueryTypes } from 'sequelize';
+
+describe('Database configuration (SQLite)', () => {
+  let tmpDir;
+  let sequelize;
+  let applySqlitePragmas;
+
+  beforeAll(async () => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'stream-schedule-db-'));
+    process.env.DATABASE_URL = '';
+    process.env.NODE_ENV = 'test';
+    process.env.SQLITE_STORAGE = path.join(tmpDir, 'test.sqlite');
+    ({ sequelize, applySqlitePragmas } = await import('../src/config/database.js'));
+    await sequelize.authenticate();
+    await applySqlitePragmas();
+  });
+
+  afterAll(async () => {
+    await sequelize?.close();
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('should enable WAL journal mode', async () => {
+    const rows = await sequelize.query('PRAGMA journal_mode', { type: QueryTypes.SELECT });
+    expect(rows[0].journal_mode).toBe('wal');
+  });
+
+  it('should set synchronous to NORMAL', async () => {
+    const rows = await sequelize.query('PRAGMA synchronous', { type: QueryTypes.SELECT });
+    expect(rows[0].synchronous).toBe(1);
+  });
+});
@@ -0,0 +1,88 @@
+/**
+ * Redis Rate Limit Store Tests
+ * Shared express-rate-limit counters across API workers
+ * Copyright © 2024-2026 Christian David Villar Colodro. All rights reserved.
+ *
+ * Run with: npm test
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+// Map-backed stand-in for the Redis client (INCR/PTTL/PEXPIRE/DECR/DEL)
+const counters = new Map();
+const expiries = new Map();
+let redisAvailable = true;
+const fakeRedis = {
+  multi() {
+    const ops = [];
+    const chain = {
+      incr: (key) => { ops.push(() => { counters.set(key, (counters.get(key) || 0) + 1); return counters.get(key); }); return chain; },
+      pttl: (key) => { ops.push(() => (expiries.has(key) ? expiries.get(key) : -1)); return chain; },
+      exec: async () => ops.map((op) => [null, op()]),
+    };
+    return chain;
+  },
+  pexpire: async (key, ms) => { expiries.set(key, ms); },
+  decr: async (key) => { counters.set(key, (counters.get(key) || 0) - 1); },
+  del: async (key) => { counters.delete(key); expiries.delete(key); },
+};
+
+vi.mock('../src/utils/redisConnection.js', () => ({
+  getCacheRedis: async () => (redisAvailable ? fakeRedis : null),
+}));
+
+const { RedisRateLimitStore } = await import('../src/utils/redisRateLimitStore.js');
+
+function createStore(name) {
+  const store = new RedisRateLimitStore(name);
+  store.init({ windowMs: 60000 });
+  return store;
+}
+
+describe('RedisRateLimitStore', () => {
+  beforeEach(() => {
+    counters.clear();
+    expiries.clear();
+    redisAvailable = true;
+  });
+
+  it('should share counters between stores with the same name (one per worker)', async () => {
+    const workerA = createStore('auth');
+    const workerB = createStore('auth');
+
+    await workerA.increment('1.2.3.4');
+    const result = await workerB.increment('1.2.3.4');
+
+    expect(result.totalHits).toBe(2);
+    expect(expiries.get('ratelimit:http:auth:1.2.3.4')).toBe(60000);
+  });
+
+  it('should keep limiters with different names separate', async () => {
+    await createStore('auth').increment('1.2.3.4');
+    const result = await createStore('api').increment('1.2.3.4');
+
+    expect(result.totalHits).toBe(1);
+  });
+
+  it('should decrement and reset shared counters', async () => {
+    const store = createStore('auth');
+    await store.increment('1.2.3.4');
+    await store.increment('1.2.3.4');
+    await store.decrement('1.2.3.4');
+    expect(counters.get('ratelimit:http:auth:1.2.3.4')).toBe(1);
+
+    await store.resetKey('1.2.3.4');
+    expect(counters.has('ratelimit:http:auth:1.2.3.4')).toBe(false);
+  });
+
+  it('should fall back to the memory store without Redis', async () => {
+    redisAvailable = false;
+    const store = createStore('auth');
+
+    await store.increment('1.2.3.4');
+    const result = await store.increment('1.2.3.4');
+
+    expect(result.totalHits).toBe(2);
+    expect(counters.size).toBe(0);
+  });
+});